@@ -1,19 +1,29 @@
 """Command line interface for arborist."""
 
+import builtins
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich import print
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from arborist.git import BranchStatus, GitError, GitRepo
+from arborist.git import BranchStatus, BranchStatusResult, GitError, GitRepo
+
+if TYPE_CHECKING:
+    from rich.table import Table
 
 app = typer.Typer(help="Git branch management tool")
 console = Console()
 
+# Rich markup for each status; statuses not listed here are shown as their plain value
+_STATUS_DISPLAY = {
+    BranchStatus.MERGED: "[green]merged[/green]",
+    BranchStatus.GONE: "[bright_yellow]gone[/bright_yellow]",
+}
+# Rich markup for the cleanable column, indexed by whether the branch is cleanable
+_CLEANABLE_DISPLAY = ("[yellow]✋[/yellow]", "[green]✅[/green]")
+
 
 def get_repo(path: Path) -> GitRepo:
     """Get git repository instance."""
@@ -24,74 +34,15 @@ def get_repo(path: Path) -> GitRepo:
         raise typer.Exit(code=1) from err
 
 
-def get_column_widths(
-    local_branches: dict[str, BranchStatus],
-    remote_branches: dict[str, BranchStatus],
-    repo: GitRepo,
-    current: str,
-) -> tuple[int, int, int, int]:
-    """Calculate maximum column widths needed for all content."""
-    branch_width = 0
-    status_width = 0
-    commit_width = 0
-    cleanable_width = len("Cleanable?")  # Width of the header
-
-    # Process local branches
-    for branch_name in local_branches:
-        # Branch name (including current indicator if applicable)
-        name_len = len(branch_name)
-        if branch_name == current:
-            name_len += len("(current)")  # Add space for the indicator
-        branch_width = max(branch_width, name_len)
-
-        # Status
-        status = local_branches[branch_name]
-        status_width = max(status_width, len(status.value))
-
-        # Last commit
-        commit = repo.get_branch_last_commit(branch_name)
-        commit_width = max(commit_width, len(commit))
-
-    # Process remote branches
-    for branch_name in remote_branches:
-        branch_width = max(branch_width, len(branch_name))
-        status = remote_branches[branch_name]
-        status_width = max(status_width, len(status.value))
-        commit = repo.get_branch_last_commit(branch_name)
-        commit_width = max(commit_width, len(commit))
-
-    return branch_width, status_width, commit_width, cleanable_width
-
-
-def create_branch_table(title: str, branch_width: int, status_width: int, commit_width: int, cleanable_width: int) -> Table:
-    """Create a table with standard branch columns."""
-    table = Table(
-        title=title,
-        show_header=True,
-        header_style="bold",
-        title_style="bold blue",
-        show_edge=True,
-    )
-
-    # Add columns with minimum widths and no truncation
-    table.add_column("Branch", style="cyan", min_width=branch_width, no_wrap=True)
-    table.add_column("Status", style="magenta", min_width=status_width, justify="center", no_wrap=True)
-    table.add_column("Last Commit", style="yellow", min_width=commit_width, no_wrap=True)
-    table.add_column("Cleanable?", style="green", min_width=cleanable_width, justify="center", no_wrap=True)
-    return table
-
+def fetch_branch_status(repo: GitRepo) -> BranchStatusResult:
+    """Fetch from remotes and get the status of all branches.
 
-@app.command()
-def list(
-    path: Annotated[Path, typer.Option(help="Path to git repository")] = Path("."),
-    silent: bool = typer.Option(False, hidden=True),  # Hidden parameter for internal use
-) -> None:
-    """List all branches with their cleanup status."""
-    repo = get_repo(path)
+    If local main is behind its remote, offer to update it before retrying.
+    """
     repo.fetch_from_remotes()  # Ensure we have latest state
 
     try:
-        status_dict = repo.get_branch_status()
+        branch_status = repo.get_local_and_remote_status()
     except GitError as err:
         if err.needs_confirmation:
             # Print without the confirmation prompt
@@ -105,7 +56,7 @@ def list(
                     # Fetch again to ensure we have the latest state
                     repo.fetch_from_remotes()
                     # Try getting branch status again
-                    status_dict = repo.get_branch_status()
+                    branch_status = repo.get_local_and_remote_status()
                 except GitError as update_err:
                     print(f"[red]Error:[/red] {update_err}")
                     raise typer.Exit(code=1) from update_err
@@ -117,84 +68,106 @@ def list(
             print(f"[red]Error:[/red] {err}")
             raise typer.Exit(code=1) from err
 
-    # Split branches into local and remote
-    local_branches = {k: v for k, v in status_dict.items() if not k.startswith("origin/") and k not in ["origin", "HEAD"]}
-    remote_branches = {k: v for k, v in status_dict.items() if k.startswith("origin/") and not k.endswith("/HEAD")}
-
-    current = repo.get_current_branch_name()
-    cleanable_local = []
-    cleanable_remote = []
+    return branch_status
 
-    # Calculate consistent column widths for both tables
-    column_widths = get_column_widths(local_branches, remote_branches, repo, current)
 
-    # Create and fill local branches table
-    local_table = create_branch_table("Local Branches", *column_widths)
-    for branch_name in sorted(local_branches.keys()):
-        status = local_branches[branch_name]
-        # Color-code the status
-        if status == BranchStatus.MERGED:
-            status_display = "[green]merged[/green]"
-        elif status == BranchStatus.GONE:
-            status_display = "[bright_yellow]gone[/bright_yellow]"
-        else:
-            status_display = status.value if status else ""
+def create_branch_table(title: str, branch_width: int, status_width: int, commit_width: int, cleanable_width: int) -> "Table":
+    """Create a table with standard branch columns."""
+    # Rendering modules are imported lazily to keep CLI startup fast
+    from rich.table import Table
 
-        # Format branch name with current indicator
-        display_name = branch_name
-        if branch_name == current:
-            display_name = f"{branch_name} [turquoise2](current)[/turquoise2]"
+    table = Table(
+        title=title,
+        show_header=True,
+        header_style="bold",
+        title_style="bold blue",
+        show_edge=True,
+    )
 
-        # Get last commit info
-        last_commit = repo.get_branch_last_commit(branch_name)
+    # Add columns with minimum widths and no truncation
+    table.add_column("Branch", style="cyan", min_width=branch_width, no_wrap=True)
+    table.add_column("Status", style="magenta", min_width=status_width, justify="center", no_wrap=True)
+    table.add_column("Last Commit", style="yellow", min_width=commit_width, no_wrap=True)
+    table.add_column("Cleanable?", style="green", min_width=cleanable_width, justify="center", no_wrap=True)
+    return table
 
-        # Check if branch is cleanable
-        cleanable = repo.is_branch_cleanable(branch_name)
-        cleanable_display = "[green]✅[/green]" if cleanable else "[yellow]✋[/yellow]"
 
-        if cleanable:
-            cleanable_local.append(branch_name)
+@app.command()
+def list(
+    path: Annotated[Path, typer.Option(help="Path to git repository")] = Path("."),
+    plain: bool = typer.Option(False, "--plain", help="Print tab-separated rows without formatting, for scripts"),
+    silent: bool = typer.Option(False, hidden=True),  # Hidden parameter for internal use
+) -> None:
+    """List all branches with their cleanup status."""
+    repo = get_repo(path)
+    branch_status = fetch_branch_status(repo)
 
-        local_table.add_row(
-            display_name,
-            status_display,
-            last_commit,
-            cleanable_display,
-        )
+    current = repo.get_current_branch_name()
+    last_commits = repo.get_branch_last_commits()
+
+    # Plain output skips Rich entirely: one line per branch with
+    # name, status, last commit and 1/0 for cleanable
+    if plain:
+        lines = []
+        for branches in (branch_status.local, branch_status.remote):
+            for branch_name in sorted(branches):
+                cleanable = repo.is_branch_cleanable(branch_name, status=branches)
+                lines.append(f"{branch_name}\t{branches[branch_name].value}\t{last_commits.get(branch_name, '')}\t{int(cleanable)}\n")
+        if not silent:
+            console.file.write("".join(lines))
+            console.file.flush()
+        return
+
+    # Build the rows for both tables in a single pass over the sorted branches
+    # (in this module `list` is the command, so the builtin is spelled out)
+    local_rows: builtins.list[tuple[str, str, str, str]] = []
+    remote_rows: builtins.list[tuple[str, str, str, str]] = []
+    cleanable_local: builtins.list[str] = []
+    cleanable_remote: builtins.list[str] = []
+
+    for branches, rows, cleanable_names in (
+        (branch_status.local, local_rows, cleanable_local),
+        (branch_status.remote, remote_rows, cleanable_remote),
+    ):
+        for branch_name in sorted(branches):
+            status = branches[branch_name]
+            status_display = _STATUS_DISPLAY.get(status, status.value)
+
+            # Format branch name with current indicator
+            display_name = branch_name
+            if branch_name == current:
+                display_name = f"{branch_name} [turquoise2](current)[/turquoise2]"
+
+            last_commit = last_commits.get(branch_name, "")
+
+            # Check if branch is cleanable
+            cleanable = repo.is_branch_cleanable(branch_name, status=branches)
+            cleanable_display = _CLEANABLE_DISPLAY[cleanable]
+            if cleanable:
+                cleanable_names.append(branch_name)
+
+            rows.append((display_name, status_display, last_commit, cleanable_display))
+
+    # Calculate column widths needed for all content, so both tables line up
+    all_statuses = [*branch_status.local.values(), *branch_status.remote.values()]
+    branch_width = max(map(len, [*branch_status.local, *branch_status.remote]), default=0)
+    if current in branch_status.local:
+        branch_width = max(branch_width, len(current) + len("(current)"))  # Add space for the indicator
+    status_width = max((len(status.value) for status in all_statuses), default=0)
+    commit_width = max((len(row[2]) for row in [*local_rows, *remote_rows]), default=0)
+    cleanable_width = len("Cleanable?")  # Width of the header
 
-    # Create and fill remote branches table
+    # Create both tables with consistent column widths
+    column_widths = (branch_width, status_width, commit_width, cleanable_width)
+    local_table = create_branch_table("Local Branches", *column_widths)
+    for row in local_rows:
+        local_table.add_row(*row)
     remote_table = create_branch_table("Remote Branches", *column_widths)
-    for branch_name in sorted(remote_branches.keys()):
-        status = remote_branches[branch_name]
-        # Color-code the status
-        if status == BranchStatus.MERGED:
-            status_display = "[green]merged[/green]"
-        elif status == BranchStatus.GONE:
-            status_display = "[bright_yellow]gone[/bright_yellow]"
-        else:
-            status_display = status.value if status else ""
-
-        # Get last commit info
-        last_commit = repo.get_branch_last_commit(branch_name)
-
-        # Check if branch is cleanable
-        cleanable = repo.is_branch_cleanable(branch_name)
-        cleanable_display = "[green]✅[/green]" if cleanable else "[yellow]✋[/yellow]"
-
-        if cleanable:
-            cleanable_remote.append(branch_name)
-
-        remote_table.add_row(
-            branch_name,
-            status_display,
-            last_commit,
-            cleanable_display,
-        )
+    for row in remote_rows:
+        remote_table.add_row(*row)
 
     if not silent:
-        # Display tables
-        console.print(local_table)
-        console.print(remote_table)
+        from rich.panel import Panel
 
         # Show message about cleanable branches
         if cleanable_local or cleanable_remote:
@@ -207,25 +180,29 @@ def list(
             msg = "The following branches would be deleted if you run [dim]`arb clean`[/dim] next:\n" + "\n".join(
                 f"  [blue]{branch}[/blue]" for branch in cleanable_branches
             )
-            console.print(
-                Panel(
-                    msg,
-                    title="Cleanable Branches",
-                    title_align="left",
-                    padding=(0, 2),
-                    expand=False,
-                )
+            summary = Panel(
+                msg,
+                title="Cleanable Branches",
+                title_align="left",
+                padding=(0, 2),
+                expand=False,
             )
         else:
-            console.print(
-                Panel(
-                    "[green]Your branches are clean ✨[/green]",
-                    style="green",
-                    padding=(0, 2),
-                    expand=False,
-                )
+            summary = Panel(
+                "[green]Your branches are clean ✨[/green]",
+                style="green",
+                padding=(0, 2),
+                expand=False,
             )
 
+        # Render everything once and write it out in a single call
+        with console.capture() as capture:
+            console.print(local_table)
+            console.print(remote_table)
+            console.print(summary)
+        console.file.write(capture.get())
+        console.file.flush()
+
 
 @app.command()
 def clean(
@@ -235,15 +212,20 @@ def clean(
     no_interactive: bool = typer.Option(False, "--no-interactive", "-y", help="Skip confirmation prompts"),
 ) -> None:
     """Clean up merged and gone branches."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     repo = get_repo(path)
     protect_list = [p.strip() for p in protect.split(",")]
 
-    # Run list command silently to ensure we have latest state
-    list(path=path, silent=True)
+    # Fetch and compute branch status once, the same way list does
+    branch_status = fetch_branch_status(repo)
+
+    status = {**branch_status.local, **branch_status.remote}
 
     try:
         # Get preview table and potentially deleted branches
-        preview_table, deleted = repo.clean(protect_list, force, not no_interactive)
+        preview_table, deleted = repo.clean(protect_list, force, not no_interactive, status=status)
         if not preview_table:
             console.print(
                 Panel(
@@ -255,9 +237,12 @@ def clean(
             )
             return
 
-        # Show preview table
-        console.print()  # Add a blank line
-        console.print(preview_table)
+        # Show preview table, rendered once and written out in a single call
+        with console.capture() as capture:
+            console.print()  # Add a blank line
+            console.print(preview_table)
+        console.file.write(capture.get())
+        console.file.flush()
 
         # If interactive, ask for confirmation
         if not no_interactive:
@@ -267,12 +252,8 @@ def clean(
                 console.print("\n[yellow]Operation cancelled[/yellow] 🛑")
                 return
 
-            # Delete branches after confirmation
-            deleted = []
-            for branch in sorted(preview_table.rows):
-                branch_name = branch.cells[0].renderable  # Access the branch name from the Row object's cells
-                if repo._delete_branch(branch_name, repo.get_branch_status()[branch_name]):
-                    deleted.append(branch_name)
+            # Delete the previewed branches after confirmation
+            _, deleted = repo.clean(protect_list, force, interactive=False, status=status, preview=False)
 
         # Show results
         if deleted:
@@ -285,11 +266,14 @@ def clean(
                 show_edge=True,
             )
             result_table.add_column("Branch", style="cyan")
-            for branch in sorted(deleted):
+            for branch in deleted:
                 result_table.add_row(branch)
 
-            console.print()  # Add a blank line
-            console.print(result_table)
+            with console.capture() as capture:
+                console.print()  # Add a blank line
+                console.print(result_table)
+            console.file.write(capture.get())
+            console.file.flush()
         else:
             console.print("\n[yellow]No branches were deleted[/yellow] 🤔")
 
@@ -1,12 +1,43 @@
 """Git repository operations."""
 
+import re
 from enum import Enum
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
-from git import GitCommandError, InvalidGitRepositoryError, Repo
-from rich.table import Table
+if TYPE_CHECKING:
+    from git import Repo
+    from rich.table import Table
+
+LAST_COMMIT_DATE_FORMAT = "%a - %B %d @ %H:%M"
+_ORIGIN_PREFIX = "origin/"
+
+
+@lru_cache(maxsize=None)
+def _git() -> ModuleType:
+    """Get the GitPython package, importing it on first use.
+
+    It is slow to import and not needed for commands like --help that never open a repository.
+    """
+    import git
+
+    return git
+
+
+@lru_cache(maxsize=32)
+def _compile_protect_patterns(protect: tuple[str, ...]) -> re.Pattern[str]:
+    """Combine branch protection glob patterns into a single regular expression.
+
+    Matching a branch name against the result is equivalent to checking it with
+    fnmatch against each pattern, without translating the patterns again every time.
+    Results are cached, so repeated checks with the same patterns reuse the compiled expression.
+    """
+    if not protect:
+        return re.compile(r"(?!)")  # Never matches
+    return re.compile("|".join(f"(?:{translate(pattern.strip())})" for pattern in protect))
 
 
 class BranchStatus(Enum):
@@ -18,6 +49,26 @@ class BranchStatus(Enum):
     EMPTY = ""  # Used for main branch
 
 
+# Statuses of branches that can be cleaned up without --force
+_CLEANABLE_STATUSES = frozenset({BranchStatus.MERGED, BranchStatus.GONE})
+
+
+class BranchStatusResult(NamedTuple):
+    """Branch status split into local and remote branches."""
+
+    local: dict[str, BranchStatus]
+    remote: dict[str, BranchStatus]
+
+
+class BranchRef(NamedTuple):
+    """A local or remote branch as reported by `git for-each-ref`."""
+
+    refname: str  # Full ref name, e.g. refs/heads/feature/x
+    name: str  # Short name, e.g. feature/x or origin/feature/x
+    upstream: str  # Full ref name of the upstream branch, empty if none is configured
+    track: str  # Upstream tracking info, e.g. "[gone]" or "[ahead 1]"
+
+
 class GitError(Exception):
     """Git operation error."""
 
@@ -37,18 +88,20 @@ class GitRepo:
 
     def __init__(self, path: Path) -> None:
         """Initialize repository."""
+        git = _git()
         try:
-            self.repo: Repo = Repo(path)
+            self.repo: Repo = git.Repo(path)
             if self.repo.bare:
                 raise GitError("Cannot operate on bare repository")
-        except (GitCommandError, ValueError, InvalidGitRepositoryError) as err:
+        except (git.GitCommandError, ValueError, git.InvalidGitRepositoryError) as err:
             raise GitError(f"Failed to open repository: {err}") from err
 
     def _has_uncommitted_changes(self) -> bool:
         """Check if there are any uncommitted changes in the repository."""
         try:
-            return bool(self.repo.index.diff(None) or self.repo.index.diff("HEAD"))
-        except GitCommandError:
+            # Staged and unstaged changes to tracked files in one call, untracked files don't need stashing
+            return bool(self.repo.git.status("--porcelain", "--untracked-files=no").strip())
+        except _git().GitCommandError:
             # If we can't check, assume there are changes to be safe
             return True
 
@@ -91,47 +144,48 @@ class GitRepo:
                 if had_changes:
                     self.repo.git.stash("pop")
 
-        except GitCommandError as err:
+        except _git().GitCommandError as err:
             raise GitError(f"Failed to update main branch: {err}") from err
 
     def _check_main_branch_status(self) -> bool:
         """Check if local main branch is up to date with remote.
 
+        Compares against the remote state from the last fetch, callers fetch first when they need it.
+
         Returns:
             bool: True if local main is up to date, False if it's behind remote
         """
         try:
-            # First ensure we have the latest remote info
-            self.fetch_from_remotes()
-
-            # Get commit counts
-            behind_count = self.repo.git.rev_list("--count", "main..origin/main").strip()
+            # List at most one commit missing from local main, git stops walking after the first
+            missing = self.repo.git.rev_list("-1", "main..origin/main").strip()
 
-            # If behind_count is not "0", local main is behind remote
-            return behind_count == "0"
-        except GitCommandError:
+            # If any commit is missing, local main is behind remote
+            return not missing
+        except _git().GitCommandError:
             # If we can't check, assume we're up to date to avoid false warnings
             return True
 
     def fetch_from_remotes(self) -> None:
         """Fetch latest state from all remotes and update local branches."""
         try:
-            for remote in self.repo.remotes:
-                # Fetch from remote
-                remote.fetch()
-                # Update local references to remote branches
-                self.repo.git.remote("update", remote.name, "--prune")
+            # Read the current branch and its upstream from the config once, not per remote
+            current = self.get_current_branch_name()
+            tracking_branch = self.repo.active_branch.tracking_branch() if current else None
+
+            remotes = self.repo.remotes
+            if remotes:
+                # Fetch every remote and prune stale remote branches in one call, letting git fetch the remotes in parallel
+                self.repo.git.fetch("--all", "--prune", f"--jobs={len(remotes)}")
+
+            for remote in remotes:
                 # Pull changes for the current branch if it has an upstream
-                current = self.get_current_branch_name()
-                if current:
+                if tracking_branch:
                     try:
-                        tracking_branch = self.repo.active_branch.tracking_branch()
-                        if tracking_branch:
-                            self.repo.git.pull(remote.name, current)
-                    except GitCommandError:
+                        self.repo.git.pull(remote.name, current)
+                    except _git().GitCommandError:
                         # If pull fails (e.g., merge conflicts), just continue
                         pass
-        except GitCommandError as err:
+        except _git().GitCommandError as err:
             raise GitError(f"Failed to fetch from remotes: {err}") from err
 
     def get_current_branch_name(self) -> str:
@@ -143,11 +197,45 @@ class GitRepo:
                 # We're in a detached HEAD state
                 # In this case, we'll return an empty string since we don't want to protect a detached HEAD
                 return ""
-        except (GitCommandError, ValueError) as err:
+        except (_git().GitCommandError, ValueError) as err:
             raise GitError(f"Failed to get current branch: {err}") from err
 
+    def _scan_refs(self) -> list[BranchRef]:
+        """Read all local and remote branches with a single `git for-each-ref` call.
+
+        Symbolic refs such as origin/HEAD are left out.
+        """
+        output = self.repo.git.for_each_ref(
+            "--format=%(refname)%00%(refname:short)%00%(symref)%00%(upstream)%00%(upstream:track)",
+            "refs/heads",
+            "refs/remotes",
+        )
+        refs = []
+        for line in output.splitlines():
+            refname, name, symref, upstream, track = line.split("\0")
+            if not symref:
+                refs.append(BranchRef(refname, name, upstream, track))
+        return refs
+
+    def _get_merged_refs(self) -> set[str]:
+        """Get the full ref names of all branches whose tip is reachable from main.
+
+        Lets git answer the merged question for every branch in a single call.
+        """
+        try:
+            output = self.repo.git.for_each_ref("--merged=main", "--format=%(refname)", "refs/heads", "refs/remotes")
+        except _git().GitCommandError:
+            # Without main, nothing can be considered merged
+            return set()
+        return set(output.splitlines())
+
     def get_branch_status(self) -> dict[str, BranchStatus]:
         """Get the status of all branches."""
+        result = self.get_local_and_remote_status()
+        return {**result.local, **result.remote}
+
+    def get_local_and_remote_status(self) -> BranchStatusResult:
+        """Get the status of all branches, split into local and remote branches."""
         try:
             # First check if local main is up to date
             if not self._check_main_branch_status():
@@ -170,189 +258,101 @@ class GitRepo:
                 )
                 raise GitError(message, needs_confirmation=True)
 
-            status: dict[str, BranchStatus] = {}
             current = self.get_current_branch_name()
+            refs = self._scan_refs()
+            merged = self._get_merged_refs()
 
-            # Get all local branches
-            local_branches = [
-                branch
-                for branch in self.repo.git.branch("--format=%(refname:short)").splitlines()
-                if not (
-                    branch.startswith("heads/")
-                    or branch.startswith("remotes/")
-                    or branch == "origin"  # Skip the special origin ref
-                    or branch == "HEAD"  # Skip HEAD ref
-                    or branch.endswith("/HEAD")  # Skip remote HEAD refs
-                )
-            ]
-            for branch_name in local_branches:
-                # Special handling for main branch
-                if branch_name == "main":
-                    status[branch_name] = BranchStatus.EMPTY
+            # Classify local branches
+            local_status: dict[str, BranchStatus] = {}
+            for ref in refs:
+                if not ref.refname.startswith("refs/heads/"):
                     continue
-
-                # Always mark current branch as unmerged
-                if branch_name == current:
-                    status[branch_name] = BranchStatus.UNMERGED
+                branch_name = ref.name
+                if (
+                    branch_name.startswith("heads/")
+                    or branch_name.startswith("remotes/")
+                    or branch_name == "origin"  # Skip the special origin ref
+                    or branch_name == "HEAD"  # Skip HEAD ref
+                    or branch_name.endswith("/HEAD")  # Skip remote HEAD refs
+                ):
                     continue
 
-                # Check if branch is gone
-                try:
-                    # Get the remote tracking configuration
-                    tracking_config = self.repo.git.config(f"branch.{branch_name}.remote")
-                    if tracking_config:
-                        remote_name = tracking_config
-                        merge_ref = self.repo.git.config(f"branch.{branch_name}.merge")
-                        if merge_ref.startswith("refs/heads/"):
-                            remote_branch = merge_ref[len("refs/heads/") :]
-                            remote_ref = f"{remote_name}/{remote_branch}"
-                            try:
-                                # Try to get the remote branch
-                                self.repo.git.rev_parse(remote_ref)
-                            except GitCommandError:
-                                # Remote branch doesn't exist, check if it's marked as gone
-                                try:
-                                    # Get branch status with -vv
-                                    branch_info = self.repo.git.branch("-vv", "--list", branch_name)
-                                    if ": gone]" in branch_info:
-                                        # Branch is marked as gone in Git
-                                        status[branch_name] = BranchStatus.GONE
-                                    else:
-                                        # Check for unpushed commits
-                                        try:
-                                            # Get number of commits that haven't been pushed
-                                            unpushed = self.repo.git.rev_list("--count", f"{branch_name}").strip()
-                                            if unpushed == "0":
-                                                # No unpushed commits, safe to mark as gone
-                                                status[branch_name] = BranchStatus.GONE
-                                            else:
-                                                # Has unpushed commits, mark as unmerged to prevent data loss
-                                                status[branch_name] = BranchStatus.UNMERGED
-                                        except GitCommandError:
-                                            # If we can't check, be conservative and mark as unmerged
-                                            status[branch_name] = BranchStatus.UNMERGED
-                                except GitCommandError:
-                                    # If we can't check, be conservative and mark as unmerged
-                                    status[branch_name] = BranchStatus.UNMERGED
-                                continue
-                except GitCommandError:
-                    # No remote tracking configuration
-                    pass
-
-                # Check if branch is merged into main
-                try:
-                    # Get the branch tip
-                    branch_tip = self.repo.git.rev_parse(branch_name).strip()
-                    # Get the main tip
-                    main_tip = self.repo.git.rev_parse("main").strip()
-                    # Branch is merged if it's either:
-                    # 1. An ancestor of main (fast-forward merge)
-                    # 2. All its commits are in main (merge commit)
-                    try:
-                        # Check if it's an ancestor (fast-forward case)
-                        self.repo.git.merge_base("--is-ancestor", branch_tip, main_tip)
-                        status[branch_name] = BranchStatus.MERGED
-                    except GitCommandError:
-                        # Check if all commits are in main (merge commit case)
-                        try:
-                            unmerged_commits = self.repo.git.rev_list("--count", f"main..{branch_name}").strip()
-                            if unmerged_commits == "0":
-                                status[branch_name] = BranchStatus.MERGED
-                            else:
-                                status[branch_name] = BranchStatus.UNMERGED
-                        except GitCommandError:
-                            status[branch_name] = BranchStatus.UNMERGED
-                except GitCommandError:
-                    status[branch_name] = BranchStatus.UNMERGED
-
-            # Get all remote branches
-            remote_branches = self.repo.git.branch("-r", "--format=%(refname:short)").splitlines()
-            for branch_name in remote_branches:
-                # Skip HEAD ref
-                if branch_name.endswith("/HEAD"):
+                if branch_name == "main":
+                    # Special handling for main branch
+                    local_status[branch_name] = BranchStatus.EMPTY
+                elif branch_name == current:
+                    # Always mark current branch as unmerged
+                    local_status[branch_name] = BranchStatus.UNMERGED
+                elif ref.upstream and ref.track == "[gone]":
+                    # Branch tracks a remote branch that no longer exists
+                    local_status[branch_name] = BranchStatus.GONE
+                elif ref.refname in merged:
+                    local_status[branch_name] = BranchStatus.MERGED
+                else:
+                    local_status[branch_name] = BranchStatus.UNMERGED
+
+            # Classify remote branches
+            remote_status: dict[str, BranchStatus] = {}
+            for ref in refs:
+                if not ref.refname.startswith("refs/remotes/"):
                     continue
-                # Skip if we already have this branch locally
-                if branch_name in status:
+                branch_name = ref.name
+                # Skip HEAD ref and branches we already have locally
+                if branch_name.endswith("/HEAD") or branch_name in local_status:
                     continue
 
-                # Special handling for origin/main
                 if branch_name == "origin/main":
-                    status[branch_name] = BranchStatus.EMPTY
-                    continue
-
-                try:
-                    # Get the branch tip and check merge status
-                    branch_tip = self.repo.git.rev_parse(branch_name).strip()
-                    main_tip = self.repo.git.rev_parse("main").strip()
-
-                    try:
-                        # Check if it's an ancestor (fast-forward case)
-                        self.repo.git.merge_base("--is-ancestor", branch_tip, main_tip)
-                        status[branch_name] = BranchStatus.MERGED
-                    except GitCommandError:
-                        # Check if all commits are in main (merge commit case)
-                        try:
-                            unmerged_commits = self.repo.git.rev_list("--count", f"main..{branch_name}").strip()
-                            if unmerged_commits == "0":
-                                status[branch_name] = BranchStatus.MERGED
-                            else:
-                                status[branch_name] = BranchStatus.UNMERGED
-                        except GitCommandError:
-                            status[branch_name] = BranchStatus.UNMERGED
-                except GitCommandError:
-                    status[branch_name] = BranchStatus.UNMERGED
-
-            return status
-        except GitCommandError as err:
+                    # Special handling for origin/main
+                    remote_status[branch_name] = BranchStatus.EMPTY
+                elif ref.refname in merged:
+                    remote_status[branch_name] = BranchStatus.MERGED
+                else:
+                    remote_status[branch_name] = BranchStatus.UNMERGED
+
+            return BranchStatusResult(local=local_status, remote=remote_status)
+        except _git().GitCommandError as err:
             raise GitError(f"Failed to get branch status: {err}") from err
 
-    def _get_branches_to_delete(self, protect: list[str], force: bool = False) -> dict[str, BranchStatus]:
+    def _get_branches_to_delete(
+        self,
+        protect: list[str],
+        force: bool = False,
+        status: Optional[dict[str, BranchStatus]] = None,
+    ) -> dict[str, BranchStatus]:
         """Get branches that can be deleted."""
-        status = self.get_branch_status()
+        status = status if status is not None else self.get_branch_status()
         current = self.get_current_branch_name()
+        protect_pattern = _compile_protect_patterns(tuple(protect))
 
-        # Remove protected branches
-        for branch_name in list(status.keys()):
-            # Skip current branch
-            if branch_name == current:
-                del status[branch_name]
-                continue
-
-            # Check if branch is protected
+        def is_protected(branch_name: str) -> bool:
             # For remote branches, check both the full name and the branch part after origin/
-            if branch_name.startswith("origin/"):
-                branch_without_remote = branch_name.split("/", 1)[1]
-                if any(fnmatch(branch_without_remote, pattern.strip()) for pattern in protect):
-                    del status[branch_name]
-                    continue
-            if any(fnmatch(branch_name, pattern.strip()) for pattern in protect):
-                del status[branch_name]
-                continue
-
-        # Remove unmerged branches unless force is True
-        if not force:
-            for branch_name, state in list(status.items()):
-                if state == BranchStatus.UNMERGED:
-                    del status[branch_name]
+            if branch_name.startswith(_ORIGIN_PREFIX) and protect_pattern.match(branch_name[len(_ORIGIN_PREFIX) :]):
+                return True
+            return protect_pattern.match(branch_name) is not None
 
-        return status
+        # Skip the current branch, protected branches and, unless force is True, unmerged branches
+        return {
+            branch_name: state
+            for branch_name, state in status.items()
+            if branch_name != current and not is_protected(branch_name) and (force or state is not BranchStatus.UNMERGED)
+        }
 
     def _delete_branch(self, branch_name: str, status: BranchStatus) -> bool:
         """Delete a single branch. Returns True if successful."""
         try:
             # Never delete main branch
-            if branch_name == "main" or (branch_name.startswith("origin/") and branch_name.split("/", 1)[1] == "main"):
+            if branch_name in ("main", f"{_ORIGIN_PREFIX}main"):
                 return False
 
             # Handle remote branches
-            if branch_name.startswith("origin/"):
-                remote_name, remote_branch = branch_name.split("/", 1)
+            if branch_name.startswith(_ORIGIN_PREFIX):
+                remote_name, _, remote_branch = branch_name.partition("/")
                 try:
                     remote = self.repo.remote(remote_name)
                     # Delete remote branch by pushing an empty reference
                     remote.push(refspec=f":{remote_branch}")
                     return True
-                except GitCommandError:
+                except _git().GitCommandError:
                     return False
 
             # Delete the local branch
@@ -360,31 +360,92 @@ class GitRepo:
                 # Always use -D for force delete since we've already checked if it's safe to delete
                 self.repo.git.branch("-D", branch_name)
                 return True
-            except GitCommandError:
+            except _git().GitCommandError:
                 return False
 
-        except GitCommandError:
+        except _git().GitCommandError:
             return False
 
+    def _delete_branches(self, branches: dict[str, BranchStatus]) -> list[str]:
+        """Delete several branches with as few git calls as possible.
+
+        Local branches are deleted with a single `git branch -D` and remote branches with a
+        single atomic push per remote. Returns the deleted branches in sorted order.
+        """
+        local_branches: list[str] = []
+        remote_branches: dict[str, list[str]] = {}
+        for branch_name in branches:
+            # Never delete main branch
+            if branch_name in ("main", f"{_ORIGIN_PREFIX}main"):
+                continue
+            if branch_name.startswith(_ORIGIN_PREFIX):
+                remote_name, _, remote_branch = branch_name.partition("/")
+                remote_branches.setdefault(remote_name, []).append(remote_branch)
+            else:
+                local_branches.append(branch_name)
+
+        deleted: set[str] = set()
+        existing = {head.name for head in self.repo.heads}
+        local_branches = [branch_name for branch_name in local_branches if branch_name in existing]
+        if local_branches:
+            try:
+                # Always use -D for force delete since we've already checked if it's safe to delete
+                self.repo.git.branch("-D", *local_branches)
+                deleted.update(local_branches)
+            except _git().GitCommandError:
+                # git deletes what it can before failing, so check which branches are left
+                remaining = {head.name for head in self.repo.heads}
+                deleted.update(branch_name for branch_name in local_branches if branch_name not in remaining)
+
+        for remote_name, remote_branch_names in remote_branches.items():
+            try:
+                # Delete remote branches by pushing empty references, all or nothing
+                self.repo.remote(remote_name).push(refspec=[f":{name}" for name in remote_branch_names], atomic=True)
+                deleted.update(f"{remote_name}/{name}" for name in remote_branch_names)
+            except (_git().GitCommandError, ValueError):
+                # Nothing was deleted, so retry one by one to delete what we can
+                for name in remote_branch_names:
+                    branch_name = f"{remote_name}/{name}"
+                    if self._delete_branch(branch_name, branches[branch_name]):
+                        deleted.add(branch_name)
+
+        return sorted(deleted)
+
     def clean(
         self,
         protect: list[str],
         force: bool = False,
         interactive: bool = True,
-    ) -> Tuple[Table, list[str]]:
+        status: Optional[dict[str, BranchStatus]] = None,
+        preview: bool = True,
+    ) -> tuple[Optional["Table"], list[str]]:
         """Clean up merged and gone branches.
 
+        Args:
+            protect: Branch patterns to protect
+            force: Whether to also delete unmerged branches
+            interactive: Whether to wait for user confirmation before deleting
+            status: Previously computed branch status, to avoid computing it again
+            preview: Whether to build the preview table, callers that already showed it can skip it
+
         Returns:
-            A tuple of (preview_table, deleted_branches).
+            A tuple of (preview_table, deleted_branches), with deleted branches in sorted order.
+            The preview table is None if there is nothing to delete or preview is False.
             If interactive is True, the branches will only be deleted after user confirmation.
         """
         try:
             # Get branches to delete
-            to_delete = self._get_branches_to_delete(protect, force)
+            to_delete = self._get_branches_to_delete(protect, force, status)
             if not to_delete:
                 return None, []
 
+            if not preview:
+                return None, [] if interactive else self._delete_branches(to_delete)
+
             # Create a table for branches to delete
+            from rich.table import Table
+            from rich.text import Text
+
             table = Table(
                 title="Branches to Delete",
                 show_header=True,
@@ -396,22 +457,20 @@ class GitRepo:
             table.add_column("Status", style="magenta", justify="center")
 
             # Add branches to table
-            for branch, status in sorted(to_delete.items()):
-                status_display = "[green]merged[/green]" if status == BranchStatus.MERGED else "[bright_yellow]gone[/bright_yellow]"
-                table.add_row(branch, status_display)
+            # Styled text is used directly so rich doesn't have to parse markup for every row
+            gone_display = Text("gone", style="bright_yellow")
+            status_display = {BranchStatus.MERGED: Text("merged", style="green"), BranchStatus.GONE: gone_display}
+            for branch, branch_status in sorted(to_delete.items()):
+                table.add_row(branch, status_display.get(branch_status, gone_display))
 
             # If not interactive, delete branches immediately
             if not interactive:
-                deleted = []
-                for branch, status in to_delete.items():
-                    if self._delete_branch(branch, status):
-                        deleted.append(branch)
-                return table, deleted
+                return table, self._delete_branches(to_delete)
 
             # Otherwise, return the table and no deleted branches
             return table, []
 
-        except GitCommandError as err:
+        except _git().GitCommandError as err:
             raise GitError(f"Failed to clean branches: {err}") from err
 
     def get_branch_last_commit(self, branch_name: str) -> str:
@@ -422,15 +481,46 @@ class GitRepo:
                 self.repo.git.log(
                     "-1",
                     "--format=%cd",
-                    "--date=format:'%a - %B %d @ %H:%M'",
+                    f"--date=format:'{LAST_COMMIT_DATE_FORMAT}'",
                     branch_name,
                 ).strip("'")
             )
-        except GitCommandError:
+        except _git().GitCommandError:
             return ""
 
-    def is_branch_cleanable(self, branch_name: str, protect: Optional[list[str]] = None) -> bool:
-        """Check if a branch can be cleaned up."""
+    def get_branch_last_commits(self) -> dict[str, str]:
+        """Get the last commit timestamp for all local and remote branches.
+
+        Uses a single `git for-each-ref` call instead of one `git log` per branch.
+        """
+        try:
+            output = self.repo.git.for_each_ref(
+                f"--format=%(refname:short)%00%(committerdate:format:{LAST_COMMIT_DATE_FORMAT})",
+                "refs/heads",
+                "refs/remotes",
+            )
+        except _git().GitCommandError:
+            return {}
+
+        last_commits: dict[str, str] = {}
+        for line in output.splitlines():
+            branch_name, _, timestamp = line.partition("\0")
+            last_commits[branch_name] = timestamp
+        return last_commits
+
+    def is_branch_cleanable(
+        self,
+        branch_name: str,
+        protect: Optional[list[str]] = None,
+        status: Optional[dict[str, BranchStatus]] = None,
+    ) -> bool:
+        """Check if a branch can be cleaned up.
+
+        Args:
+            branch_name: Name of the branch to check
+            protect: Branch patterns to protect, defaults to ["main"]
+            status: Previously computed branch status, to avoid computing it again
+        """
         if protect is None:
             protect = ["main"]
 
@@ -443,18 +533,19 @@ class GitRepo:
 
         # Check if branch is protected
         # For remote branches, check both the full name and the branch part after origin/
-        if branch_name.startswith("origin/"):
-            branch_without_remote = branch_name.split("/", 1)[1]
-            if any(fnmatch(branch_without_remote, pattern) for pattern in protect):
+        protect_pattern = _compile_protect_patterns(tuple(protect))
+        if branch_name.startswith(_ORIGIN_PREFIX):
+            branch_without_remote = branch_name[len(_ORIGIN_PREFIX) :]
+            if protect_pattern.match(branch_without_remote):
                 return False
-        if any(fnmatch(branch_name, pattern) for pattern in protect):
+        if protect_pattern.match(branch_name):
             return False
 
         # Get branch status
-        status = self.get_branch_status()
+        if status is None:
+            status = self.get_branch_status()
         if branch_name not in status:
             return False
 
         # Only merged or gone branches can be cleaned
-        branch_status = status[branch_name]
-        return branch_status in [BranchStatus.MERGED, BranchStatus.GONE]
+        return status[branch_name] in _CLEANABLE_STATUSES
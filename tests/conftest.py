@@ -1,19 +1,64 @@
 """Test configuration and fixtures."""
 
+import os
+import shutil
 from pathlib import Path
 from typing import Generator
 
 import pytest
-from git import Actor, Repo
+from git import Repo
+
+from arborist.git import GitRepo
+
+# Global git config for the test session: a fixed identity, main as the default branch and merge on pull.
+# The throwaway test repositories also skip fsync and automatic gc.
+GIT_CONFIG = """\
+[core]
+    fsync = none
+[gc]
+    auto = 0
+[receive]
+    autogc = false
+[user]
+    name = Test User
+    email = test@example.com
+[init]
+    defaultBranch = main
+[pull]
+    rebase = false
+"""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def git_config(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Run git with a known global config, independent of the developer's own settings.
+
+    Yields:
+        Path to the global git config file used by the tests
+    """
+    config_path = tmp_path_factory.mktemp("gitconfig") / "gitconfig"
+    config_path.write_text(GIT_CONFIG)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(config_path))
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        # GitPython commits through the index and reads the identity from the environment before any config
+        for role in ("AUTHOR", "COMMITTER"):
+            monkeypatch.setenv(f"GIT_{role}_NAME", "Test User")
+            monkeypatch.setenv(f"GIT_{role}_EMAIL", "test@example.com")
+        yield config_path
 
 
-@pytest.fixture
-def test_env(tmp_path: Path) -> Generator[tuple[Path, Path], None, None]:
-    """Create a test environment with local and remote repositories.
+@pytest.fixture(scope="session")
+def golden_env(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """Build the local and remote test repositories once per test session.
+
+    Tests must not use these directly, test_env hands out a private copy.
 
     Returns:
         Tuple of (local_repo_path, remote_repo_path)
     """
+    tmp_path = tmp_path_factory.mktemp("golden")
+
     # Create temporary directories for both repos
     remote_path = tmp_path / "remote"
     local_path = tmp_path / "local"
@@ -21,28 +66,22 @@ def test_env(tmp_path: Path) -> Generator[tuple[Path, Path], None, None]:
     local_path.mkdir()
 
     # Initialize remote repo
-    Repo.init(remote_path, bare=True)
-
-    # Initialize local repo
-    local_repo = Repo.init(local_path)
+    Repo.init(remote_path, bare=True, initial_branch="main")
 
-    # Set up git config
-    author = Actor("Test User", "test@example.com")
-    local_repo.config_writer().set_value("user", "name", author.name).release()
-    local_repo.config_writer().set_value("user", "email", author.email).release()
+    # Initialize local repo on main
+    local_repo = Repo.init(local_path, initial_branch="main")
+    with local_repo.config_writer() as config:
+        # Keep globally configured hooks from running on (and slowing down) every test commit and push.
+        # Set on the repository only, the global config is inherited by install-dev.sh where pre-commit
+        # refuses to install hooks while core.hooksPath is set.
+        config.set_value("core", "hooksPath", os.devnull)
 
-    # Create initial commit in local repo and set up main branch
+    # Create initial commit in local repo
     readme = local_path / "README.md"
     readme.write_text("# Test Repository")
     local_repo.index.add(["README.md"])
-    local_repo.index.commit("Initial commit", author=author)
-
-    # Ensure we're on main branch
-    if "main" not in local_repo.heads:
-        # Create main branch if it doesn't exist
-        local_repo.create_head("main")
+    local_repo.index.commit("Initial commit")
     main_branch = local_repo.heads.main
-    main_branch.checkout()
 
     # Add remote
     origin = local_repo.create_remote("origin", url=str(remote_path))
@@ -67,7 +106,7 @@ def test_env(tmp_path: Path) -> Generator[tuple[Path, Path], None, None]:
         test_file.parent.mkdir(parents=True, exist_ok=True)
         test_file.write_text(content)
         local_repo.index.add([f"{name}.txt"])
-        local_repo.index.commit(f"Add {name}", author=author)
+        local_repo.index.commit(f"Add {name}")
 
         # Push branch to remote and set up tracking
         origin.push(name)
@@ -85,7 +124,7 @@ def test_env(tmp_path: Path) -> Generator[tuple[Path, Path], None, None]:
     test_file = local_path / "feature/test.txt"
     test_file.write_text("More test branch content")
     local_repo.index.add(["feature/test.txt"])
-    local_repo.index.commit("Update test branch", author=author)
+    local_repo.index.commit("Update test branch")
     local_repo.remote("origin").push("feature/test")
 
     create_branch("feature/merged", "Merged branch content", merge=True)
@@ -97,28 +136,50 @@ def test_env(tmp_path: Path) -> Generator[tuple[Path, Path], None, None]:
     local_repo.git.branch("--set-upstream-to=origin/feature/gone", "feature/gone")
     origin.push(":feature/gone")  # Delete in remote
 
-    # Debug: Print branch and tracking info
-    print("\nDEBUG: Branch and tracking info:")
-    print(local_repo.git.branch("-vv"))
-    print("\nDEBUG: Remote branches:")
-    print(local_repo.git.branch("-r"))
-
     # Create a remote-only branch
     main_branch.checkout()
     local_repo.create_head("feature/remote", "main")
     test_file = local_path / "feature_remote.txt"
     test_file.write_text("Remote branch content")
     local_repo.index.add(["feature_remote.txt"])
-    local_repo.index.commit("Add remote branch", author=author)
+    local_repo.index.commit("Add remote branch")
     origin.push("feature/remote")
     local_repo.delete_head("feature/remote")
 
     # Switch to feature/current as the active branch
     local_repo.heads["feature/current"].checkout()
 
-    yield local_path, remote_path
+    return local_path, remote_path
+
+
+@pytest.fixture
+def test_env(golden_env: tuple[Path, Path], tmp_path: Path) -> tuple[Path, Path]:
+    """Create a test environment with local and remote repositories.
+
+    Copies the session's golden repositories, which is much faster than building them with git again.
+
+    Returns:
+        Tuple of (local_repo_path, remote_repo_path)
+    """
+    golden_local, golden_remote = golden_env
+    local_path = tmp_path / "local"
+    remote_path = tmp_path / "remote"
+    shutil.copytree(golden_remote, remote_path)
+    shutil.copytree(golden_local, local_path)
+
+    # Point the copy at its own remote
+    with Repo(local_path) as local_repo:
+        local_repo.remote("origin").set_url(str(remote_path))
 
     # Cleanup is handled by pytest's tmp_path fixture
+    return local_path, remote_path
+
+
+@pytest.fixture
+def repo(test_env: tuple[Path, Path]) -> GitRepo:
+    """Open the local test repository."""
+    local_path, _ = test_env
+    return GitRepo(local_path)
 
 
 @pytest.fixture
@@ -3,131 +3,177 @@
 from pathlib import Path
 
 import pytest
-from git import Actor, Repo
+from git import Repo
 
 from arborist.git import BranchStatus, GitError, GitRepo
 
+# Abbreviated weekday names that last commit timestamps start with
+DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
-def test_main_branch_empty_status(test_env: tuple[Path, Path]) -> None:
+
+def test_main_branch_empty_status(repo: GitRepo) -> None:
     """Test that main branch has empty status."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     status = repo.get_branch_status()
     assert status["main"] == BranchStatus.EMPTY
 
 
-def test_main_branch_last_commit(test_env: tuple[Path, Path]) -> None:
+def test_local_and_remote_status_split(repo: GitRepo) -> None:
+    """Test that branch status is split into local and remote branches."""
+    result = repo.get_local_and_remote_status()
+    assert result.local["feature/merged"] == BranchStatus.MERGED
+    assert result.remote["origin/feature/remote"] == BranchStatus.MERGED
+    assert not any(branch.startswith("origin/") for branch in result.local)
+    assert all(branch.startswith("origin/") for branch in result.remote)
+
+
+def test_branch_status_sees_branches_created_without_moving_head(repo: GitRepo) -> None:
+    """Test that a branch created after a status query shows up in the next one."""
+    assert "feature/new" not in repo.get_branch_status()
+
+    # Creating a branch leaves HEAD where it is
+    repo.repo.git.branch("feature/new", "main")
+    assert repo.get_branch_status()["feature/new"] == BranchStatus.MERGED
+
+
+def test_branch_status_sees_branches_deleted_elsewhere(repo: GitRepo) -> None:
+    """Test that a branch deleted through another repository object is gone from the next status query."""
+    assert "feature/merged" in repo.get_branch_status()
+
+    GitRepo(Path(repo.repo.working_dir)).repo.git.branch("-D", "feature/merged")
+    assert "feature/merged" not in repo.get_branch_status()
+
+
+def test_main_branch_last_commit(repo: GitRepo) -> None:
     """Test that main branch last commit is formatted correctly."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     timestamp = repo.get_branch_last_commit("main")
     # We can't test the exact timestamp since it depends on when the test runs
     assert " @ " in timestamp  # Check for time separator
     assert " - " in timestamp  # Check for date separator
-    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    assert any(day in timestamp for day in days)
+    assert timestamp.startswith(DAYS)
 
 
-def test_feature_branch_last_commit(test_env: tuple[Path, Path]) -> None:
+def test_feature_branch_last_commit(repo: GitRepo) -> None:
     """Test that feature branch last commit is formatted correctly."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     timestamp = repo.get_branch_last_commit("feature/test")
     # We can't test the exact timestamp since it depends on when the test runs
     assert " @ " in timestamp  # Check for time separator
     assert " - " in timestamp  # Check for date separator
-    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    assert any(day in timestamp for day in days)
+    assert timestamp.startswith(DAYS)
 
 
-def test_remote_branch_last_commit(test_env: tuple[Path, Path]) -> None:
+def test_remote_branch_last_commit(repo: GitRepo) -> None:
     """Test that remote branch last commit is formatted correctly."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     timestamp = repo.get_branch_last_commit("origin/feature/remote")
     # We can't test the exact timestamp since it depends on when the test runs
     assert " @ " in timestamp  # Check for time separator
     assert " - " in timestamp  # Check for date separator
-    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    assert any(day in timestamp for day in days)
+    assert timestamp.startswith(DAYS)
+
 
+def test_branch_last_commits_match_single_lookup(repo: GitRepo) -> None:
+    """Test that bulk last commit lookup matches the per-branch lookup."""
+    last_commits = repo.get_branch_last_commits()
+    for branch_name in ["main", "feature/test", "origin/feature/remote"]:
+        assert last_commits[branch_name] == repo.get_branch_last_commit(branch_name)
 
-def test_main_branch_not_cleanable(test_env: tuple[Path, Path]) -> None:
+
+def test_main_branch_not_cleanable(repo: GitRepo) -> None:
     """Test that main branch is never cleanable."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     assert not repo.is_branch_cleanable("main")
 
 
-def test_current_branch_not_cleanable(test_env: tuple[Path, Path]) -> None:
+def test_current_branch_not_cleanable(repo: GitRepo) -> None:
     """Test that current branch is never cleanable."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     assert not repo.is_branch_cleanable("feature/current")
 
 
-def test_merged_branch_cleanable(test_env: tuple[Path, Path]) -> None:
+def test_current_branch_follows_external_checkout(repo: GitRepo) -> None:
+    """Test that checking out a branch outside arborist makes it the current branch."""
+    assert repo.get_current_branch_name() == "feature/current"
+
+    repo.repo.git.checkout("feature/merged")
+    assert repo.get_current_branch_name() == "feature/merged"
+    assert not repo.is_branch_cleanable("feature/merged")
+
+
+def test_merged_branch_cleanable(repo: GitRepo) -> None:
     """Test that merged branches are cleanable."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     status = repo.get_branch_status()
     assert status["feature/merged"] == BranchStatus.MERGED
     assert repo.is_branch_cleanable("feature/merged")
 
 
-def test_unmerged_branch_not_cleanable(test_env: tuple[Path, Path]) -> None:
+def test_unmerged_branch_not_cleanable(repo: GitRepo) -> None:
     """Test that unmerged branches are not cleanable."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     assert not repo.is_branch_cleanable("feature/test")
 
 
-def test_protected_branch_not_cleanable(test_env: tuple[Path, Path]) -> None:
+def test_protected_branch_not_cleanable(repo: GitRepo) -> None:
     """Test that protected branches are not cleanable."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     assert not repo.is_branch_cleanable("feature/merged", protect=["feature/*"])
 
 
-def test_gone_branch_cleanable(test_env: tuple[Path, Path]) -> None:
+def test_gone_branch_cleanable(repo: GitRepo) -> None:
     """Test that gone branches are cleanable."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     status = repo.get_branch_status()
     assert status["feature/gone"] == BranchStatus.GONE
     assert repo.is_branch_cleanable("feature/gone")
 
 
-def test_nonexistent_branch_not_cleanable(test_env: tuple[Path, Path]) -> None:
+def test_nonexistent_branch_not_cleanable(repo: GitRepo) -> None:
     """Test that nonexistent branches are not cleanable."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     assert not repo.is_branch_cleanable("nonexistent/branch")
 
 
-def test_delete_local_branch(test_env: tuple[Path, Path]) -> None:
+def test_delete_local_branch(repo: GitRepo) -> None:
     """Test deleting a local branch."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     assert repo._delete_branch("feature/test", BranchStatus.MERGED)
     # Verify branch is gone
     assert "feature/test" not in repo.get_branch_status()
 
 
-def test_delete_remote_branch(test_env: tuple[Path, Path]) -> None:
+def test_delete_remote_branch(repo: GitRepo) -> None:
     """Test deleting a remote branch."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     assert repo._delete_branch("origin/feature/remote", BranchStatus.MERGED)
     # Verify branch is gone from remote
     remote_branches = [ref.remote_head for ref in repo.repo.remote().refs]
     assert "feature/remote" not in remote_branches
 
 
-def test_cannot_delete_main_branch_with_force(test_env: tuple[Path, Path]) -> None:
+def test_delete_branches_in_batch(repo: GitRepo) -> None:
+    """Test deleting several local and remote branches at once."""
+    deleted = repo._delete_branches(
+        {
+            "feature/merged": BranchStatus.MERGED,
+            "feature/gone": BranchStatus.GONE,
+            "origin/feature/merged": BranchStatus.MERGED,
+            "origin/feature/remote": BranchStatus.MERGED,
+            "main": BranchStatus.EMPTY,
+        }
+    )
+    assert deleted == ["feature/gone", "feature/merged", "origin/feature/merged", "origin/feature/remote"]
+
+    status = repo.get_branch_status()
+    assert "main" in status
+    for branch_name in deleted:
+        assert branch_name not in status
+
+
+def test_delete_branches_partial_failure(repo: GitRepo) -> None:
+    """Test that a failing branch doesn't stop the others from being deleted."""
+    deleted = repo._delete_branches(
+        {
+            "feature/merged": BranchStatus.MERGED,
+            "nonexistent": BranchStatus.GONE,
+            "origin/feature/remote": BranchStatus.MERGED,
+            "origin/nonexistent": BranchStatus.GONE,
+        }
+    )
+    assert deleted == ["feature/merged", "origin/feature/remote"]
+
+
+def test_cannot_delete_main_branch_with_force(repo: GitRepo) -> None:
     """Test that main branch cannot be deleted even with force."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
 
     # Try to delete main branch directly
     assert not repo._delete_branch("main", BranchStatus.MERGED)
@@ -188,9 +234,6 @@ def test_unpushed_commits_not_gone(test_env: tuple[Path, Path]) -> None:
 
     # Get branch status
     status = repo.get_branch_status()
-    print("\nDEBUG: Branch status:")
-    for branch, branch_status in status.items():
-        print(f"{branch}: {branch_status.value}")
 
     # Verify branch is not marked as gone
     assert status["test/unpushed"] == BranchStatus.UNMERGED
@@ -235,26 +278,19 @@ def test_fetch_from_remotes_no_remote(tmp_path: Path) -> None:
     local_repo = Repo.init(tmp_path)
     repo = GitRepo(tmp_path)
 
-    # Set up git config
-    author = Actor("Test User", "test@example.com")
-    local_repo.config_writer().set_value("user", "name", author.name).release()
-    local_repo.config_writer().set_value("user", "email", author.email).release()
-
     # Create initial commit
     readme = tmp_path / "README.md"
     readme.write_text("# Test Repository")
     local_repo.index.add(["README.md"])
-    local_repo.index.commit("Initial commit", author=author)
+    local_repo.index.commit("Initial commit")
 
     # Fetch should succeed even with no remotes
     repo.fetch_from_remotes()
     assert len(repo.repo.remotes) == 0
 
 
-def test_fetch_from_remotes_error(test_env: tuple[Path, Path]) -> None:
+def test_fetch_from_remotes_error(repo: GitRepo) -> None:
     """Test handling of fetch errors."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
 
     # Simulate a fetch error by changing the remote URL to an invalid one
     repo.repo.remote("origin").set_url("invalid://url")
@@ -265,18 +301,25 @@ def test_fetch_from_remotes_error(test_env: tuple[Path, Path]) -> None:
     assert "Failed to fetch from remotes" in str(exc_info.value)
 
 
-def test_origin_main_empty_status(test_env: tuple[Path, Path]) -> None:
+def test_branch_status_does_not_fetch(repo: GitRepo) -> None:
+    """Test that getting branch status uses the last fetched state instead of fetching."""
+    repo.fetch_from_remotes()
+
+    # Fetching again would fail with the remote unreachable
+    repo.repo.remote("origin").set_url("invalid://url")
+
+    status = repo.get_branch_status()
+    assert status["main"] == BranchStatus.EMPTY
+
+
+def test_origin_main_empty_status(repo: GitRepo) -> None:
     """Test that origin/main branch has empty status."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
     status = repo.get_branch_status()
     assert status["origin/main"] == BranchStatus.EMPTY
 
 
-def test_get_branch_status_filters_special_refs(test_env: tuple[Path, Path]) -> None:
+def test_get_branch_status_filters_special_refs(repo: GitRepo) -> None:
     """Test that get_branch_status properly filters out special refs like 'origin'."""
-    local_path, _ = test_env
-    repo = GitRepo(local_path)
 
     # Create the problematic "origin" ref that we see in real repositories
     test_repo = repo.repo
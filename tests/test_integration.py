@@ -4,16 +4,42 @@ Tests various branch cleanup scenarios.
 Includes tests for branch listing, cleaning, and protection.
 """
 
-import tempfile
+import logging
+import re
 from pathlib import Path
 
 import pytest
-from git import Actor, Repo
+from git import Repo
 from typer.testing import CliRunner
 
 from arborist.cli import app
 from arborist.git import GitRepo
 
+# Branch cell of a table row, panel lines have no second column and don't match
+TABLE_ROW_RE = re.compile(r"^│\s*([^│]+?)\s*│[^│\n]*│", re.MULTILINE)
+
+logger = logging.getLogger(__name__)
+
+
+def _log_state(repo: GitRepo) -> None:
+    """Log the current branch and branch status, only computed when debug logging is enabled."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Current branch: %s", repo.get_current_branch_name())
+    for branch, status in repo.get_branch_status().items():
+        logger.debug("%s: %s", branch, status.value)
+
+
+def _parse_table(stdout: str) -> list[str]:
+    """Get the branch names from the rows of the tables in the output."""
+    return TABLE_ROW_RE.findall(stdout)
+
+
+def assert_contains_all(output: str, *needles: str) -> None:
+    """Assert that every needle appears in the output, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, f"Missing from output: {missing}"
+
 
 @pytest.fixture
 def test_repo(test_env: tuple[Path, Path]) -> Path:
@@ -22,9 +48,9 @@ def test_repo(test_env: tuple[Path, Path]) -> Path:
     return local_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
-    """Create a CLI test runner."""
+    """Create a CLI test runner, shared by all tests since it keeps no state between invocations."""
     return CliRunner()
 
 
@@ -32,21 +58,13 @@ def test_list_command(test_repo: Path, runner: CliRunner) -> None:
     """Test the list command."""
     result = runner.invoke(app, ["list", "--path", str(test_repo)])
     assert result.exit_code == 0
-    assert "feature/merged" in result.stdout
-    assert "feature/test" in result.stdout
-    assert "feature/current" in result.stdout
-    assert "✅" in result.stdout
-    assert "✋" in result.stdout
+    stdout = result.stdout
+    assert "✅" in stdout
+    assert "✋" in stdout
 
-    # Verify branch names are on single lines (no line breaks in branch names)
-    lines = result.stdout.splitlines()
-    for line in lines:
-        # Only check table rows that contain branch names (exclude summary sections)
-        if "│" in line:  # This is a table row
-            if "feature/" in line and not line.startswith("│ origin/"):  # Local branch
-                assert line.count("feature/") == 1  # Branch name should be on a single line
-            elif "origin/feature/" in line:  # Remote branch
-                assert line.count("origin/feature/") == 1  # Branch name should be on a single line
+    # Verify whole branch names are in the table cells (no line breaks in branch names)
+    branches = set(_parse_table(stdout))
+    assert {"feature/merged", "feature/test", "feature/current (current)", "origin/feature/merged"} <= branches
 
 
 def test_list_command_silent_mode(test_repo: Path, runner: CliRunner) -> None:
@@ -56,6 +74,18 @@ def test_list_command_silent_mode(test_repo: Path, runner: CliRunner) -> None:
     assert not result.stdout  # Silent mode should produce no output
 
 
+def test_list_command_plain_mode(test_repo: Path, runner: CliRunner) -> None:
+    """Test that list command in plain mode prints tab-separated rows."""
+    result = runner.invoke(app, ["list", "--path", str(test_repo), "--plain"])
+    assert result.exit_code == 0
+    assert "│" not in result.stdout
+    rows = {line.split("\t")[0]: line.split("\t") for line in result.stdout.splitlines()}
+    assert rows["feature/merged"][1] == "merged"
+    assert rows["feature/merged"][3] == "1"
+    assert rows["feature/test"][3] == "0"
+    assert rows["origin/feature/remote"][1] == "merged"
+
+
 def test_fetch_before_list(test_repo: Path, runner: CliRunner) -> None:
     """Test that list command fetches from remotes before displaying branches."""
     repo = GitRepo(test_repo)
@@ -99,73 +129,41 @@ def test_fetch_before_clean(test_repo: Path, runner: CliRunner) -> None:
 
 def test_clean_uses_list_state(test_repo: Path, runner: CliRunner) -> None:
     """Test that clean command uses list command's state."""
-    # First run list to get initial state
-    list_result = runner.invoke(app, ["list", "--path", str(test_repo)])
+    # First run list to get initial state, plain rows end with 1 for cleanable branches
+    list_result = runner.invoke(app, ["list", "--path", str(test_repo), "--plain"])
     assert list_result.exit_code == 0
+    rows = [line.split("\t") for line in list_result.stdout.splitlines()]
+    expected = sorted(row[0] for row in rows if row[-1] == "1")
+    assert expected
+
+    repo = GitRepo(test_repo)
+    initial_branches = repo.get_branch_status()
 
     # Run clean command with no-interactive mode
     clean_result = runner.invoke(app, ["clean", "--path", str(test_repo), "--no-interactive"])
     assert clean_result.exit_code == 0
 
-    # Extract cleanable branches from list output
-    list_cleanable = []
-    for line in list_result.stdout.splitlines():
-        if "✅" in line:
-            # Extract branch name from the line (between first two │ characters)
-            parts = line.split("│")
-            if len(parts) >= 2:
-                branch = parts[1].strip()
-                # Remove (current) indicator if present
-                branch = branch.replace(" (current)", "")
-                list_cleanable.append(branch)
-
-    # Extract branches that were deleted from clean output
-    clean_branches = []
-    for line in clean_result.stdout.splitlines():
-        if "Successfully deleted" in line:
-            # The next lines will contain the branch names
-            continue
-        if "│" in line:  # Table row
-            parts = line.split("│")
-            if len(parts) >= 2:
-                branch = parts[1].strip()
-                if branch and not branch == "Branch":  # Skip header row
-                    clean_branches.append(branch)
-
-    # Sort and deduplicate the lists
-    list_cleanable = sorted(set(list_cleanable))
-    clean_branches = sorted(set(clean_branches))
-
-    # Verify both commands identified the same branches
-    assert list_cleanable == clean_branches
-
-    # Verify repo state
-    repo = GitRepo(test_repo)
-    branches = repo.get_branch_status()
-    assert "main" in branches
+    # Verify clean deleted exactly those branches and kept main
+    final_branches = repo.get_branch_status()
+    assert expected == sorted(initial_branches.keys() - final_branches.keys())
+    assert "main" in final_branches
 
 
 def test_clean_merged_branch(test_repo: Path, runner: CliRunner) -> None:
     """Test cleaning a merged branch."""
     # First verify the repo state
     repo = GitRepo(test_repo)
-    print("\nDEBUG: Initial repo state:")
-    print(f"DEBUG: Current branch: {repo.get_current_branch_name()}")
-    print("DEBUG: Branch status:")
-    for branch, status in repo.get_branch_status().items():
-        print(f"DEBUG: {branch}: {status.value}")
+    _log_state(repo)
 
     # Run the clean command with the correct repo path
     result = runner.invoke(app, ["clean", "--no-interactive", "--path", str(test_repo)])
-    print("\nDEBUG: Clean command output:")
-    print(result.stdout)
+    logger.debug("Clean command output:\n%s", result.stdout)
 
     assert result.exit_code == 0
     assert "feature/merged" in result.stdout
     assert "Successfully deleted" in result.stdout
 
     # Verify branch is gone
-    repo = GitRepo(test_repo)
     branches = repo.get_branch_status()
     assert "feature/merged" not in branches
 
@@ -192,52 +190,47 @@ def test_clean_preview(test_repo: Path, runner: CliRunner) -> None:
     """Test preview mode with confirmation cancelled."""
     # First verify the repo state
     repo = GitRepo(test_repo)
-    print("\nDEBUG: Initial repo state:")
-    print(f"DEBUG: Current branch: {repo.get_current_branch_name()}")
-    print("DEBUG: Branch status:")
-    for branch, status in repo.get_branch_status().items():
-        print(f"DEBUG: {branch}: {status.value}")
+    _log_state(repo)
 
     # Run the clean command with interactive mode and simulate 'n' input
     result = runner.invoke(app, ["clean", "--path", str(test_repo)], input="n\n")
-    print("\nDEBUG: Clean command output:")
-    print(result.stdout)
+    logger.debug("Clean command output:\n%s", result.stdout)
 
     assert result.exit_code == 0
     assert "Operation cancelled" in result.stdout
 
 
-def test_invalid_repo(runner: CliRunner) -> None:
+def test_clean_confirmed(test_repo: Path, runner: CliRunner) -> None:
+    """Test interactive mode with deletion confirmed."""
+    result = runner.invoke(app, ["clean", "--path", str(test_repo)], input="y\n")
+
+    assert result.exit_code == 0
+    assert "Successfully deleted" in result.stdout
+
+    # Verify branch is gone
+    repo = GitRepo(test_repo)
+    branches = repo.get_branch_status()
+    assert "feature/merged" not in branches
+
+
+def test_invalid_repo(tmp_path: Path, runner: CliRunner) -> None:
     """Test handling of invalid repository path."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        result = runner.invoke(app, ["list", "--path", temp_dir])
-        assert result.exit_code == 1
-        assert "Failed to open repository" in result.stdout
+    result = runner.invoke(app, ["list", "--path", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "Failed to open repository" in result.stdout
 
 
 def test_multiple_protection_patterns(test_repo: Path, runner: CliRunner) -> None:
     """Test multiple branch protection patterns."""
-    # Debug output
     repo = GitRepo(test_repo)
-    print("\nDEBUG: Initial repo state:")
-    print(f"DEBUG: Git version: {repo.repo.git.version()}")
-    print("DEBUG: Git config:")
-    config = repo.repo.config_reader()
-    for section in config.sections():
-        for key, value in config.items(section):
-            print(f"DEBUG: {section}.{key}: {value}")
-    print("\nDEBUG: Branch status:")
-    for branch, status in repo.get_branch_status().items():
-        print(f"DEBUG: {branch}: {status.value}")
+    _log_state(repo)
 
-    result = runner.invoke(app, ["clean", "--protect", "feature/*,hotfix/*", "--no-interactive"])
-    print("\nDEBUG: Clean command output:")
-    print(result.stdout)
+    result = runner.invoke(app, ["clean", "--protect", "feature/*,hotfix/*", "--no-interactive", "--path", str(test_repo)])
+    logger.debug("Clean command output:\n%s", result.stdout)
 
     assert result.exit_code == 0
 
     # Verify protected branches still exist
-    repo = GitRepo(test_repo)
     branches = repo.get_branch_status()
     assert "feature/merged" in branches
 
@@ -246,23 +239,17 @@ def test_force_delete_unmerged(test_repo: Path, runner: CliRunner) -> None:
     """Test force deletion of unmerged branches."""
     # First verify the repo state
     repo = GitRepo(test_repo)
-    print("\nDEBUG: Initial repo state:")
-    print(f"DEBUG: Current branch: {repo.get_current_branch_name()}")
-    print("DEBUG: Branch status:")
-    for branch, status in repo.get_branch_status().items():
-        print(f"DEBUG: {branch}: {status.value}")
+    _log_state(repo)
 
     # Run the clean command with the correct repo path
     result = runner.invoke(app, ["clean", "--force", "--no-interactive", "--path", str(test_repo)])
-    print("\nDEBUG: Clean command output:")
-    print(result.stdout)
+    logger.debug("Clean command output:\n%s", result.stdout)
 
     assert result.exit_code == 0
     assert "feature/test" in result.stdout
     assert "Successfully deleted" in result.stdout
 
     # Verify branch is gone
-    repo = GitRepo(test_repo)
     branches = repo.get_branch_status()
     assert "feature/test" not in branches
 
@@ -271,21 +258,15 @@ def test_cannot_delete_main_branch_with_force(test_repo: Path, runner: CliRunner
     """Test that main branch cannot be deleted even with force."""
     # First verify the repo state
     repo = GitRepo(test_repo)
-    print("\nDEBUG: Initial repo state:")
-    print(f"DEBUG: Current branch: {repo.get_current_branch_name()}")
-    print("DEBUG: Branch status:")
-    for branch, status in repo.get_branch_status().items():
-        print(f"DEBUG: {branch}: {status.value}")
+    _log_state(repo)
 
     # Try to force delete main branch
     result = runner.invoke(app, ["clean", "--force", "--no-interactive", "--protect", "", "--path", str(test_repo)])
-    print("\nDEBUG: Clean command output:")
-    print(result.stdout)
+    logger.debug("Clean command output:\n%s", result.stdout)
 
     assert result.exit_code == 0
 
     # Verify main branch still exists
-    repo = GitRepo(test_repo)
     branches = repo.get_branch_status()
     assert "main" in branches
 
@@ -319,11 +300,6 @@ def test_list_shows_latest_remote_status(test_repo: Path, runner: CliRunner) ->
     remote_clone_path = test_repo.parent / "remote_clone"
     remote_clone = Repo.clone_from(str(test_repo_obj.remote().url), str(remote_clone_path))
 
-    # Set up git config in remote clone
-    author = Actor("Test User", "test@example.com")
-    remote_clone.config_writer().set_value("user", "name", author.name).release()
-    remote_clone.config_writer().set_value("user", "email", author.email).release()
-
     # Fetch and merge the branch into main in the remote clone
     remote_clone.git.fetch("origin", "test/remote-status:test/remote-status")
     remote_clone.git.checkout("main")
@@ -351,11 +327,6 @@ def test_list_warns_when_main_behind(test_repo: Path, runner: CliRunner) -> None
     remote_clone_path = test_repo.parent / "remote_clone"
     remote_clone = Repo.clone_from(str(test_repo_obj.remote().url), str(remote_clone_path))
 
-    # Set up git config in remote clone
-    author = Actor("Test User", "test@example.com")
-    remote_clone.config_writer().set_value("user", "name", author.name).release()
-    remote_clone.config_writer().set_value("user", "email", author.email).release()
-
     # Make a change in the remote clone and push to main
     test_file = remote_clone_path / "test_main_behind.txt"
     test_file.write_text("test content")
@@ -379,12 +350,8 @@ def test_list_warns_when_main_behind(test_repo: Path, runner: CliRunner) -> None
     # Try again with automatic update
     result = runner.invoke(app, ["list", "--path", str(test_repo)], input="y\n")  # Choose automatic update
     assert result.exit_code == 0
-    # Verify we can see the branch status table
-    assert "Local Branches" in result.stdout
-    assert "Remote Branches" in result.stdout
-    # Verify the branch status is correct
-    assert "feature/current (current)" in result.stdout
-    assert "origin/main" in result.stdout
+    # Verify we can see the branch status table with the right branches
+    assert_contains_all(result.stdout, "Local Branches", "Remote Branches", "feature/current (current)", "origin/main")
 
 
 def test_list_handles_uncommitted_changes(test_repo: Path, runner: CliRunner) -> None:
@@ -396,11 +363,6 @@ def test_list_handles_uncommitted_changes(test_repo: Path, runner: CliRunner) ->
     remote_clone_path = test_repo.parent / "remote_clone"
     remote_clone = Repo.clone_from(str(test_repo_obj.remote().url), str(remote_clone_path))
 
-    # Set up git config in remote clone
-    author = Actor("Test User", "test@example.com")
-    remote_clone.config_writer().set_value("user", "name", author.name).release()
-    remote_clone.config_writer().set_value("user", "email", author.email).release()
-
     # Make a change in the remote clone and push to main
     test_file = remote_clone_path / "test_main_behind.txt"
     test_file.write_text("test content")
@@ -416,8 +378,7 @@ def test_list_handles_uncommitted_changes(test_repo: Path, runner: CliRunner) ->
     # Run list command with automatic update
     result = runner.invoke(app, ["list", "--path", str(test_repo)], input="y\n")
     assert result.exit_code == 0
-    assert "Local Branches" in result.stdout
-    assert "Remote Branches" in result.stdout
+    assert_contains_all(result.stdout, "Local Branches", "Remote Branches")
 
     # Verify our uncommitted changes are still there
     assert local_file.read_text() == "uncommitted changes"